@@ -0,0 +1,302 @@
+"""
+Load-test matrix for the generated starters.
+
+Generates each stack x dbEngine variant (with the loadtest addon), boots it
+and drives it with the offline load generator from
+templates/fastapi/addons/loadtest/loadtest.py (crud, list and write
+workloads). Prints requests/second and latency percentiles per variant and
+can fail on regressions against a saved baseline.
+
+By default DBs are in-process stand-ins, so nothing needs the network:
+  - SQLite variants use their real embedded DB
+  - FastAPI postgres/mysql run their SQLAlchemy addon against a SQLite file
+  - Variants without a stand-in (Mongo, Express postgres/mysql) are skipped
+With --docker every variant runs through its generated docker-compose.yml
+against real DB containers instead.
+
+Express variants need an installed node_modules to reuse (--node-modules
+DIR); without it they are skipped, since `npm install` needs the network.
+
+Usage (from backend/):
+    python loadtest_matrix.py
+    python loadtest_matrix.py --stacks fastapi --db none,sqlite --duration 5
+    python loadtest_matrix.py --docker --json results.json
+    python loadtest_matrix.py --baseline results.json --max-regression 0.2
+"""
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app import (
+    AVAILABLE_STACKS,
+    TEMPLATES_DIR,
+    ScaffoldRequest,
+    render_generated_files,
+    resolve_template_files,
+)
+
+DB_ENGINES = ["none", "sqlite", "postgres", "mysql", "mongo"]
+
+# Variants that can run without containers, and the env overrides they need.
+# "{dir}" is replaced by the generated project folder.
+STANDINS: Dict[str, Dict[str, str]] = {
+    "fastapi/none": {},
+    "fastapi/sqlite": {},
+    "fastapi/postgres": {"DATABASE_URL": "sqlite:///{dir}/standin.db"},
+    "fastapi/mysql": {"DATABASE_URL": "sqlite:///{dir}/standin.db"},
+    "express/none": {},
+    "express/sqlite": {},
+}
+
+# The docker-compose files publish the API here
+DOCKER_URL = "http://localhost:8000"
+
+# Runs app.db.init_db() (sync or async) inside a generated FastAPI project
+INIT_DB_SNIPPET = (
+    "import asyncio, inspect\n"
+    "from app import db\n"
+    "result = db.init_db()\n"
+    "if inspect.isawaitable(result):\n"
+    "    asyncio.run(result)\n"
+)
+
+def load_generator():
+    """Import the load generator shipped by the FastAPI loadtest addon."""
+    path = TEMPLATES_DIR / "fastapi" / "addons" / "loadtest" / "loadtest.py"
+    spec = importlib.util.spec_from_file_location("devstart_loadtest", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_project(body: ScaffoldRequest, dest: Path) -> None:
+    """Write the project scaffold_project would generate, without the zip."""
+    files = resolve_template_files(body)
+    for rel_path, src in files.items():
+        if rel_path == "README_TEMPLATE.md":
+            continue
+        target = dest / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, target)
+    for rel_path, content in render_generated_files(body, files).items():
+        (dest / rel_path).write_text(content, encoding="utf-8")
+
+
+def read_env_file(path: Path) -> Dict[str, str]:
+    env: Dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "=" in line:
+            key, _, value = line.partition("=")
+            env[key.strip()] = value.strip()
+    return env
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_healthy(url: str, timeout: float, proc: Optional[subprocess.Popen] = None) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc is not None and proc.poll() is not None:
+            raise RuntimeError(f"process exited with code {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"{url}/health", timeout=2) as res:
+                if res.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.3)
+    raise RuntimeError(f"/health not ready after {timeout:.0f}s")
+
+
+def start_standin(stack_id: str, variant: str, project_dir: Path, args) -> Tuple[subprocess.Popen, str]:
+    """Start the generated app as a local process; return (process, base URL)."""
+    port = free_port()
+    env = {**os.environ, **read_env_file(project_dir / ".env")}
+    env.update({k: v.format(dir=project_dir) for k, v in STANDINS[variant].items()})
+    env["DB_INIT_RETRIES"] = "1"
+
+    if stack_id == "fastapi":
+        if args.workers > 1 and (project_dir / "app" / "db.py").exists():
+            # Real Postgres/MySQL serialize init_db() with a DB lock; the SQLite
+            # stand-ins don't, so create the schema once before the workers start
+            subprocess.run(
+                [sys.executable, "-c", INIT_DB_SNIPPET],
+                cwd=project_dir, env=env, check=True, capture_output=True, text=True,
+            )
+        cmd = [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(args.workers), "--log-level", "warning",
+        ]
+    else:
+        (project_dir / "node_modules").symlink_to(Path(args.node_modules).resolve())
+        env["PORT"] = str(port)
+        env["WEB_CONCURRENCY"] = str(args.workers)
+        cmd = ["node", "src/cluster.js" if args.workers > 1 else "src/index.js"]
+
+    log = open(project_dir / "server.log", "w", encoding="utf-8")
+    proc = subprocess.Popen(cmd, cwd=project_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+    return proc, f"http://127.0.0.1:{port}"
+
+
+def stop_standin(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def compose(project_dir: Path, variant: str, *cmd: str) -> None:
+    name = "devstart-loadtest-" + variant.replace("/", "-")
+    subprocess.run(
+        ["docker", "compose", "-p", name, *cmd],
+        cwd=project_dir, check=True, capture_output=True, text=True,
+    )
+
+
+def run_variant(stack_id: str, db_engine: str, workdir: Path, generator, args) -> List[Dict]:
+    variant = f"{stack_id}/{db_engine}"
+    if not args.docker and variant not in STANDINS:
+        return [{"variant": variant, "status": "skipped", "reason": "no stand-in (use --docker)"}]
+    if not args.docker and stack_id == "express" and not args.node_modules:
+        return [{"variant": variant, "status": "skipped", "reason": "needs --node-modules"}]
+
+    project_dir = workdir / variant.replace("/", "-")
+    body = ScaffoldRequest(
+        projectName=f"loadtest-{stack_id}-{db_engine}",
+        stackId=stack_id,
+        dbEngine=db_engine,
+        includeDocker=args.docker,
+        includeLoadTest=True,
+    )
+    generate_project(body, project_dir)
+
+    proc = None
+    try:
+        if args.docker:
+            compose(project_dir, variant, "up", "-d", "--build")
+            url = DOCKER_URL
+            wait_until_healthy(url, args.startup_timeout)
+        else:
+            proc, url = start_standin(stack_id, variant, project_dir, args)
+            wait_until_healthy(url, args.startup_timeout, proc)
+
+        results = []
+        for scenario in args.scenarios:
+            result = generator.run(url, scenario, args.duration, args.concurrency, args.warmup)
+            # Nothing finished in the window: the server stalled (e.g. pool timeouts)
+            status = "ok" if result["requests"] else "failed"
+            results.append({"variant": variant, "status": status, **result})
+            print(f"{variant:<18} {generator.format_result(result)}", flush=True)
+        return results
+    except (RuntimeError, OSError, subprocess.SubprocessError) as e:
+        detail = getattr(e, "stderr", None) or str(e)
+        log_file = project_dir / "server.log"
+        if log_file.exists():
+            detail += "\n" + log_file.read_text(encoding="utf-8")[-2000:]
+        print(f"{variant:<18} FAILED: {detail.strip()}", flush=True)
+        return [{"variant": variant, "status": "failed", "reason": detail.strip()}]
+    finally:
+        if proc is not None:
+            stop_standin(proc)
+        if args.docker:
+            try:
+                compose(project_dir, variant, "down", "-v", "--remove-orphans")
+            except (OSError, subprocess.SubprocessError):
+                pass
+
+
+def find_regressions(results: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """Compare RPS and p99 latency with a previous run's --json output."""
+    previous = {
+        (r["variant"], r["scenario"]): r for r in baseline if r.get("status") == "ok"
+    }
+    regressions = []
+    for r in results:
+        old = previous.get((r["variant"], r.get("scenario")))
+        if r["status"] != "ok" or old is None:
+            continue
+        if r["rps"] < old["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{r['variant']} {r['scenario']}: {r['rps']} req/s (baseline {old['rps']})"
+            )
+        if r["latency_ms"]["p99"] > old["latency_ms"]["p99"] * (1 + tolerance):
+            regressions.append(
+                f"{r['variant']} {r['scenario']}: p99 {r['latency_ms']['p99']} ms "
+                f"(baseline {old['latency_ms']['p99']} ms)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test every generated stack x dbEngine.")
+    parser.add_argument("--stacks", default=",".join(s.id for s in AVAILABLE_STACKS))
+    parser.add_argument("--db", default=",".join(DB_ENGINES), help="comma-separated dbEngines")
+    parser.add_argument("--scenarios", default="crud,list,write")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=1, help="server processes per variant")
+    parser.add_argument("--docker", action="store_true", help="use docker compose and real DBs")
+    parser.add_argument("--node-modules", help="installed node_modules to reuse for Express")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--json", help="write all results to this file")
+    parser.add_argument("--baseline", help="previous --json output to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="allowed RPS drop / p99 increase vs the baseline (0.2 = 20%%)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated projects")
+    args = parser.parse_args()
+
+    generator = load_generator()
+    args.scenarios = args.scenarios.split(",")
+    for scenario in args.scenarios:
+        if scenario not in generator.SCENARIOS:
+            parser.error(f"unknown scenario '{scenario}'")
+
+    workdir = Path(tempfile.mkdtemp(prefix="devstart-loadtest-"))
+    results: List[Dict] = []
+    try:
+        for stack_id in args.stacks.split(","):
+            for db_engine in args.db.split(","):
+                results.extend(run_variant(stack_id, db_engine, workdir, generator, args))
+    finally:
+        if args.keep:
+            print(f"Generated projects kept in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    for r in results:
+        if r["status"] == "skipped":
+            print(f"Skipped {r['variant']}: {r['reason']}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    failed = any(r["status"] == "failed" or r.get("errors") for r in results)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = find_regressions(results, baseline, args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,7 +13,15 @@ async function connectMongo() {
   console.log("[mongo] connecting to", uri);
 
   try {
-    await mongoose.connect(uri);
+    // Pool size is per process (WEB_CONCURRENCY * DB_POOL_MAX in cluster mode)
+    const connectionTimeoutMs = Number(process.env.DB_POOL_CONNECTION_TIMEOUT_MS || "5000");
+    await mongoose.connect(uri, {
+      maxPoolSize: Number(process.env.DB_POOL_MAX || "10"),
+      maxIdleTimeMS: Number(process.env.DB_POOL_IDLE_TIMEOUT_MS || "30000"),
+      // Fail fast when no server is reachable instead of the 30s driver default
+      serverSelectionTimeoutMS: connectionTimeoutMs,
+      connectTimeoutMS: connectionTimeoutMs,
+    });
     isConnected = true;
     console.log("[mongo] connected");
   } catch (err) {
@@ -27,7 +35,15 @@ async function checkConnection() {
   await connectMongo();
 }
 
+// Close the connection pool (used on graceful shutdown)
+async function close() {
+  if (!isConnected) return;
+  await mongoose.disconnect();
+  isConnected = false;
+}
+
 module.exports = {
   connectMongo,
   checkConnection,
+  close,
 };
@@ -1,5 +1,13 @@
 const mysql = require("mysql2/promise");
 
+// Optional metrics addon (src/metrics.js) for query timing
+let metrics = null;
+try {
+  metrics = require("../metrics");
+} catch (err) {
+  // metrics addon not selected
+}
+
 let pool;
 
 /**
@@ -20,6 +28,10 @@ function getPool() {
   const user = process.env.DB_USER || "app_user";
   const password = process.env.DB_PASSWORD || "app_password";
 
+  // Pool sizing is per process: in cluster mode the total number of
+  // connections is WEB_CONCURRENCY * DB_POOL_MAX.
+  const connectionLimit = Number(process.env.DB_POOL_MAX || "10");
+
   pool = mysql.createPool({
     host,
     port,
@@ -27,7 +39,11 @@ function getPool() {
     user,
     password,
     waitForConnections: true,
-    connectionLimit: 10,
+    connectionLimit,
+    maxIdle: connectionLimit,
+    idleTimeout: Number(process.env.DB_POOL_IDLE_TIMEOUT_MS || "30000"),
+    connectTimeout: Number(process.env.DB_POOL_CONNECTION_TIMEOUT_MS || "5000"),
+    enableKeepAlive: true,
   });
 
   return pool;
@@ -38,7 +54,10 @@ function getPool() {
  * mysql2 returns [rows, fields]
  */
 async function query(sql, params = []) {
-  const [rows] = await getPool().query(sql, params);
+  const run = () => getPool().query(sql, params);
+  const [rows] = metrics
+    ? await metrics.timeDbQuery("mysql", sql, run)
+    : await run();
   return rows;
 }
 
@@ -50,7 +69,20 @@ function sleep(ms) {
 }
 
 /**
- * Create the items table, retrying until MySQL is ready.
+ * Create an index unless it already exists (MySQL has no CREATE INDEX IF NOT EXISTS).
+ */
+async function ensureIndex(indexName, ddl) {
+  const rows = await query(
+    `SELECT 1 FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'items' AND index_name = ?
+     LIMIT 1`,
+    [indexName]
+  );
+  if (!rows.length) await query(ddl);
+}
+
+/**
+ * Create the items table and its search indexes, retrying until MySQL is ready.
  */
 async function initDb(retries = 10, delayMs = 2000) {
   for (let attempt = 1; attempt <= retries; attempt++) {
@@ -66,6 +98,13 @@ async function initDb(retries = 10, delayMs = 2000) {
           description TEXT NULL
         )
       `);
+      // btree: ?name=, ?prefix= and ?sort=name
+      await ensureIndex("ix_items_name", "CREATE INDEX ix_items_name ON items (name)");
+      // FULLTEXT: ?q= (MATCH ... AGAINST)
+      await ensureIndex(
+        "ix_items_name_fulltext",
+        "CREATE FULLTEXT INDEX ix_items_name_fulltext ON items (name)"
+      );
 
       console.log("Items table is ready");
       return;
@@ -94,10 +133,18 @@ async function checkConnection() {
   await healthCheck();
 }
 
+/**
+ * Close the pool (used on graceful shutdown).
+ */
+async function close() {
+  if (pool) await pool.end();
+}
+
 module.exports = {
   getPool,
   query,
   initDb,
   healthCheck,
   checkConnection,
+  close,
 };
@@ -3,51 +3,136 @@ const db = require("../db"); // uses src/db/index.js
 
 const router = express.Router();
 
+// Max rows returned by GET / (page with ?offset=)
+const LIST_LIMIT = 1000;
+
+// ?sort= values; id is the tie-breaker so pages are stable
+const SORT_ORDER = {
+  id: "id ASC",
+  "-id": "id DESC",
+  name: "name ASC, id ASC",
+  "-name": "name DESC, id ASC",
+};
+
+// Escape LIKE wildcards so user input is matched literally (ESCAPE '/')
+function escapeLike(value) {
+  return value.replace(/[/%_]/g, "/$&");
+}
+
+// Free text -> BOOLEAN MODE query: every word must match as a word prefix
+// ("blue wid" -> "+blue* +wid*")
+function fulltextTerms(value) {
+  return (value.match(/[\p{L}\p{N}_]+/gu) || []).map((w) => `+${w}*`).join(" ");
+}
+
 // GET /db/items
-router.get("/", async (_req, res) => {
-  const rows = await db.query(
-    "SELECT id, name, description FROM items ORDER BY id ASC"
-  );
-  res.json(rows);
+//   ?name=    exact name                         (btree index)
+//   ?prefix=  name starts with                   (btree index)
+//   ?q=       full-text search on words in name  (FULLTEXT index)
+//   ?sort=    id | -id | name | -name
+//   ?limit= / ?offset=
+router.get("/", async (req, res, next) => {
+  const { name, prefix, q } = req.query;
+  const sort = req.query.sort ?? "id";
+  const limit = Number(req.query.limit ?? LIST_LIMIT);
+  const offset = Number(req.query.offset ?? 0);
+
+  if (!Object.hasOwn(SORT_ORDER, sort)) {
+    return res.status(400).json({ error: "sort must be id, -id, name or -name" });
+  }
+  if (!Number.isInteger(limit) || limit < 1 || limit > LIST_LIMIT) {
+    return res.status(400).json({ error: `limit must be 1-${LIST_LIMIT}` });
+  }
+  if (!Number.isInteger(offset) || offset < 0) {
+    return res.status(400).json({ error: "offset must be >= 0" });
+  }
+
+  const where = [];
+  const params = [];
+  if (typeof name === "string") {
+    where.push("name = ?");
+    params.push(name);
+  }
+  if (typeof prefix === "string" && prefix) {
+    where.push("name LIKE ? ESCAPE '/'");
+    params.push(`${escapeLike(prefix)}%`);
+  }
+  if (typeof q === "string" && q) {
+    const terms = fulltextTerms(q);
+    if (terms) {
+      where.push("MATCH (name) AGAINST (? IN BOOLEAN MODE)");
+      params.push(terms);
+    } else {
+      // No words to search for (e.g. only punctuation): plain substring match
+      where.push("name LIKE ? ESCAPE '/'");
+      params.push(`%${escapeLike(q)}%`);
+    }
+  }
+  params.push(limit, offset);
+
+  try {
+    const rows = await db.query(
+      `SELECT id, name, description FROM items
+       ${where.length ? `WHERE ${where.join(" AND ")}` : ""}
+       ORDER BY ${SORT_ORDER[sort]}
+       LIMIT ? OFFSET ?`,
+      params
+    );
+    res.json(rows);
+  } catch (err) {
+    next(err);
+  }
 });
 
 // POST /db/items
-router.post("/", async (req, res) => {
+router.post("/", async (req, res, next) => {
   const { name, description } = req.body;
   if (!name) return res.status(400).json({ error: "name required" });
 
-  const result = await db.query(
-    "INSERT INTO items (name, description) VALUES (?, ?)",
-    [name, description ?? null]
-  );
+  try {
+    const result = await db.query(
+      "INSERT INTO items (name, description) VALUES (?, ?)",
+      [name, description ?? null]
+    );
 
-  const inserted = await db.query(
-    "SELECT id, name, description FROM items WHERE id = ?",
-    [result.insertId]
-  );
-
-  res.status(201).json(inserted[0]);
+    // insertId is all we need, no second round trip to read the row back
+    res.status(201).json({
+      id: result.insertId,
+      name,
+      description: description ?? null,
+    });
+  } catch (err) {
+    next(err);
+  }
 });
 
 // GET /db/items/:id
-router.get("/:id", async (req, res) => {
-  const rows = await db.query(
-    "SELECT id, name, description FROM items WHERE id = ?",
-    [req.params.id]
-  );
-
-  if (!rows.length) return res.status(404).json({ error: "Not found" });
-  res.json(rows[0]);
+router.get("/:id", async (req, res, next) => {
+  try {
+    const rows = await db.query(
+      "SELECT id, name, description FROM items WHERE id = ?",
+      [req.params.id]
+    );
+
+    if (!rows.length) return res.status(404).json({ error: "Not found" });
+    res.json(rows[0]);
+  } catch (err) {
+    next(err);
+  }
 });
 
 // DELETE /db/items/:id
-router.delete("/:id", async (req, res) => {
-  const result = await db.query("DELETE FROM items WHERE id = ?", [
-    req.params.id,
-  ]);
+router.delete("/:id", async (req, res, next) => {
+  try {
+    const result = await db.query("DELETE FROM items WHERE id = ?", [
+      req.params.id,
+    ]);
 
-  if (!result.affectedRows) return res.status(404).json({ error: "Not found" });
-  res.status(204).end();
+    if (!result.affectedRows) return res.status(404).json({ error: "Not found" });
+    res.status(204).end();
+  } catch (err) {
+    next(err);
+  }
 });
 
 module.exports = router;
@@ -1,5 +1,13 @@
 const { Pool } = require("pg");
 
+// Optional metrics addon (src/metrics.js) for query timing
+let metrics = null;
+try {
+  metrics = require("../metrics");
+} catch (err) {
+  // metrics addon not selected
+}
+
 let pool;
 
 /**
@@ -17,12 +25,24 @@ function getPool() {
   const user = process.env.DB_USER || "app_user";
   const password = process.env.DB_PASSWORD || "app_password";
 
+  // Pool sizing is per process: in cluster mode the total number of
+  // connections is WEB_CONCURRENCY * DB_POOL_MAX.
   pool = new Pool({
     host,
     port,
     database,
     user,
     password,
+    max: Number(process.env.DB_POOL_MAX || "10"),
+    idleTimeoutMillis: Number(process.env.DB_POOL_IDLE_TIMEOUT_MS || "30000"),
+    connectionTimeoutMillis: Number(
+      process.env.DB_POOL_CONNECTION_TIMEOUT_MS || "5000"
+    ),
+  });
+
+  // An idle client losing its connection should not crash the process
+  pool.on("error", (err) => {
+    console.error("Postgres pool error:", err.message);
   });
 
   return pool;
@@ -30,15 +50,13 @@ function getPool() {
 
 /**
  * Simple helper to run queries.
+ * pool.query checks out a client, runs the query and releases it for us.
  */
 async function query(text, params) {
-  const client = await getPool().connect();
-  try {
-    const res = await client.query(text, params);
-    return res;
-  } finally {
-    client.release();
-  }
+  if (!metrics) return getPool().query(text, params);
+  return metrics.timeDbQuery("postgres", text, () =>
+    getPool().query(text, params)
+  );
 }
 
 /**
@@ -49,7 +67,7 @@ function sleep(ms) {
 }
 
 /**
- * Create the items table, retrying until Postgres is ready.
+ * Create the items table and its search indexes, retrying until Postgres is ready.
  */
 async function initDb(retries = 10, delayMs = 2000) {
   for (let attempt = 1; attempt <= retries; attempt++) {
@@ -62,6 +80,13 @@ async function initDb(retries = 10, delayMs = 2000) {
           description TEXT
         );
       `);
+      // btree: ?name= and ?sort=name
+      await query("CREATE INDEX IF NOT EXISTS ix_items_name ON items (name)");
+      // Trigram GIN: ?prefix= and ?q= (ILIKE '%...%')
+      await query("CREATE EXTENSION IF NOT EXISTS pg_trgm");
+      await query(
+        "CREATE INDEX IF NOT EXISTS ix_items_name_trgm ON items USING gin (name gin_trgm_ops)"
+      );
       console.log("Items table is ready");
       return;
     } catch (err) {
@@ -90,10 +115,18 @@ async function checkConnection() {
   await healthCheck();
 }
 
+/**
+ * Close the pool (used on graceful shutdown).
+ */
+async function close() {
+  if (pool) await pool.end();
+}
+
 module.exports = {
   getPool,
   query,
   initDb,
   healthCheck,
   checkConnection,
-};
\ No newline at end of file
+  close,
+};
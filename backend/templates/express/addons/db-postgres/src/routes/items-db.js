@@ -2,11 +2,67 @@ const express = require("express");
 const router = express.Router();
 const db = require("../db");
 
-// GET /items  -> list all items
-router.get("/", async (_req, res, next) => {
+// Max rows returned by GET / (page with ?offset=)
+const LIST_LIMIT = 1000;
+
+// ?sort= values; id is the tie-breaker so pages are stable
+const SORT_ORDER = {
+  id: "id ASC",
+  "-id": "id DESC",
+  name: "name ASC, id ASC",
+  "-name": "name DESC, id ASC",
+};
+
+// Escape LIKE wildcards so user input is matched literally (ESCAPE '/')
+function escapeLike(value) {
+  return value.replace(/[/%_]/g, "/$&");
+}
+
+// GET /items  -> list items
+//   ?name=    exact name                      (btree index)
+//   ?prefix=  name starts with, case-sensitive (trigram index)
+//   ?q=       name contains, case-insensitive  (trigram index)
+//   ?sort=    id | -id | name | -name
+//   ?limit= / ?offset=
+router.get("/", async (req, res, next) => {
+  const { name, prefix, q } = req.query;
+  const sort = req.query.sort ?? "id";
+  const limit = Number(req.query.limit ?? LIST_LIMIT);
+  const offset = Number(req.query.offset ?? 0);
+
+  if (!Object.hasOwn(SORT_ORDER, sort)) {
+    return res.status(400).json({ detail: "sort must be id, -id, name or -name" });
+  }
+  if (!Number.isInteger(limit) || limit < 1 || limit > LIST_LIMIT) {
+    return res.status(400).json({ detail: `limit must be 1-${LIST_LIMIT}` });
+  }
+  if (!Number.isInteger(offset) || offset < 0) {
+    return res.status(400).json({ detail: "offset must be >= 0" });
+  }
+
+  const where = [];
+  const params = [];
+  if (typeof name === "string") {
+    params.push(name);
+    where.push(`name = $${params.length}`);
+  }
+  if (typeof prefix === "string" && prefix) {
+    params.push(`${escapeLike(prefix)}%`);
+    where.push(`name LIKE $${params.length} ESCAPE '/'`);
+  }
+  if (typeof q === "string" && q) {
+    params.push(`%${escapeLike(q)}%`);
+    where.push(`name ILIKE $${params.length} ESCAPE '/'`);
+  }
+  params.push(limit, offset);
+
   try {
     const result = await db.query(
-      "SELECT id, name, description FROM items ORDER BY id ASC"
+      `SELECT id, name, description FROM items
+       ${where.length ? `WHERE ${where.join(" AND ")}` : ""}
+       ORDER BY ${SORT_ORDER[sort]}
+       LIMIT $${params.length - 1} OFFSET $${params.length}`,
+      params
     );
     res.json(result.rows);
   } catch (err) {
@@ -0,0 +1,126 @@
+const fs = require("fs");
+const path = require("path");
+const Database = require("better-sqlite3");
+
+// Optional metrics addon (src/metrics.js) for query timing
+let metrics = null;
+try {
+  metrics = require("../metrics");
+} catch (err) {
+  // metrics addon not selected
+}
+
+const SYNCHRONOUS_MODES = ["OFF", "NORMAL", "FULL", "EXTRA"];
+
+let db;
+const statements = new Map();
+
+/**
+ * Open (or reuse) the single connection for this process.
+ *
+ * better-sqlite3 is synchronous, so one connection per process already
+ * serializes writes (SQLite allows one writer at a time). WAL lets reads
+ * run while another cluster worker is writing.
+ */
+function getDb() {
+  if (db) return db;
+
+  /*The database file location has to be in env file.
+  This was left here as a fallback so you will need to update this on your end*/
+  const file = process.env.SQLITE_DB_PATH || "./data/db.sqlite";
+  fs.mkdirSync(path.dirname(file), { recursive: true });
+
+  const synchronous = (process.env.SQLITE_SYNCHRONOUS || "NORMAL").toUpperCase();
+  if (!SYNCHRONOUS_MODES.includes(synchronous)) {
+    throw new Error(`Invalid SQLITE_SYNCHRONOUS: ${synchronous}`);
+  }
+
+  // timeout: how long a write waits for another worker's lock (busy_timeout)
+  db = new Database(file, {
+    timeout: Number(process.env.SQLITE_BUSY_TIMEOUT_MS || "5000"),
+  });
+
+  db.pragma("journal_mode = WAL");
+  // NORMAL is safe with WAL: a power loss can only lose the last commits
+  db.pragma(`synchronous = ${synchronous}`);
+  // Bytes of the file read through mmap instead of read() syscalls
+  db.pragma(`mmap_size = ${Number(process.env.SQLITE_MMAP_SIZE || "268435456")}`);
+  // Negative values are KiB (-65536 = 64 MiB page cache)
+  db.pragma(`cache_size = ${Number(process.env.SQLITE_CACHE_SIZE || "-65536")}`);
+  db.pragma("temp_store = MEMORY");
+  db.pragma("foreign_keys = ON");
+
+  return db;
+}
+
+/**
+ * Prepare each SQL string once and reuse the statement.
+ */
+function prepare(sql) {
+  let stmt = statements.get(sql);
+  if (!stmt) {
+    stmt = getDb().prepare(sql);
+    statements.set(sql, stmt);
+  }
+  return stmt;
+}
+
+/**
+ * Simple helper to run queries.
+ * SELECTs return rows; other statements return { changes, lastInsertRowid }.
+ * Kept async so routes look the same as the other DB addons.
+ */
+async function query(sql, params = []) {
+  const run = () => {
+    const stmt = prepare(sql);
+    return stmt.reader ? stmt.all(params) : stmt.run(params);
+  };
+  return metrics ? metrics.timeDbQuery("sqlite", sql, run) : run();
+}
+
+/**
+ * Create the items table and its index. The DB is a local file, so no retry loop.
+ */
+async function initDb() {
+  getDb().exec(`
+    CREATE TABLE IF NOT EXISTS items (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      name TEXT NOT NULL,
+      description TEXT
+    );
+    -- btree: ?name=, ?prefix= and ?sort=name
+    CREATE INDEX IF NOT EXISTS ix_items_name ON items (name);
+  `);
+  console.log("Items table is ready");
+}
+
+/**
+ * Used by /health-db style endpoints.
+ */
+async function healthCheck() {
+  await query("SELECT 1");
+}
+
+async function checkConnection() {
+  await healthCheck();
+}
+
+/**
+ * Close the connection (used on graceful shutdown).
+ */
+async function close() {
+  if (db) {
+    statements.clear();
+    db.close();
+    db = undefined;
+  }
+}
+
+module.exports = {
+  getDb,
+  query,
+  initDb,
+  healthCheck,
+  checkConnection,
+  close,
+};
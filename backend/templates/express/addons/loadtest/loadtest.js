@@ -0,0 +1,234 @@
+/*
+ * Offline load generator for this API (Node built-ins only, no network
+ * access or extra packages needed).
+ *
+ * Usage (with the API running):
+ *   node loadtest.js
+ *   node loadtest.js --scenario list --duration 30 --concurrency 64
+ *   node loadtest.js --url http://localhost:8000 --json results.json
+ *
+ * Scenarios run against /db/items/ when a DB addon is mounted, else /items:
+ *   crud   50% list, 20% get, 20% create, 10% delete
+ *   list   90% list, 10% get
+ *   write  80% create, 20% delete
+ *
+ * Operations the API doesn't expose (e.g. no DELETE route) are skipped.
+ * Prints requests/second and latency percentiles for the measured window;
+ * errors counts 5xx responses and connection failures.
+ */
+const fs = require("fs");
+const http = require("http");
+
+const SCENARIOS = {
+  crud: { list: 50, get: 20, create: 20, delete: 10 },
+  list: { list: 90, get: 10 },
+  write: { create: 80, delete: 20 },
+};
+
+// Items created before measuring so list/get have something to read
+const SEED_ITEMS = 100;
+
+// Page size sent with list requests (ignored by routes without ?limit=)
+const LIST_LIMIT = 50;
+
+function parseArgs(argv) {
+  const args = {
+    url: "http://localhost:8000",
+    scenario: "all",
+    duration: 10,
+    warmup: 2,
+    concurrency: 32,
+    path: null,
+    json: null,
+  };
+  for (let i = 0; i < argv.length; i += 2) {
+    const key = argv[i].replace(/^--/, "");
+    if (!(key in args)) throw new Error(`Unknown option --${key}`);
+    args[key] = ["duration", "warmup", "concurrency"].includes(key)
+      ? Number(argv[i + 1])
+      : argv[i + 1];
+  }
+  if (args.scenario !== "all" && !SCENARIOS[args.scenario]) {
+    throw new Error(`Unknown scenario ${args.scenario}`);
+  }
+  return args;
+}
+
+function request(agent, base, method, path, body) {
+  const payload = body === undefined ? null : JSON.stringify(body);
+  return new Promise((resolve, reject) => {
+    const req = http.request(
+      new URL(path, base),
+      {
+        method,
+        agent,
+        headers: payload
+          ? { "Content-Type": "application/json", "Content-Length": Buffer.byteLength(payload) }
+          : {},
+      },
+      (res) => {
+        const chunks = [];
+        res.on("data", (chunk) => chunks.push(chunk));
+        res.on("end", () =>
+          resolve({ status: res.statusCode, body: Buffer.concat(chunks).toString() })
+        );
+      }
+    );
+    req.on("error", reject);
+    req.end(payload);
+  });
+}
+
+// Nearest-rank percentile of an already sorted array
+function percentile(sorted, pct) {
+  if (!sorted.length) return 0;
+  return sorted[Math.max(1, Math.ceil((pct / 100) * sorted.length)) - 1];
+}
+
+function pickWeighted(mix) {
+  const total = Object.values(mix).reduce((a, b) => a + b, 0);
+  let roll = Math.random() * total;
+  for (const [op, weight] of Object.entries(mix)) {
+    roll -= weight;
+    if (roll < 0) return op;
+  }
+  return Object.keys(mix)[0];
+}
+
+async function runScenario({ url, scenario, duration, warmup, concurrency, path }) {
+  // One keep-alive socket per virtual user. noDelay: small requests are
+  // sent immediately instead of waiting on Nagle's algorithm (~40 ms stalls).
+  const agent = new http.Agent({ keepAlive: true, maxSockets: concurrency, noDelay: true });
+  const send = (method, p, body) => request(agent, url, method, p, body);
+  const ids = [];
+  let created = 0;
+
+  const itemPath = (id) => `${path.replace(/\/$/, "")}/${id}`;
+  const create = async () => {
+    created += 1;
+    const res = await send("POST", path, { name: `item-${created}`, description: "load test" });
+    if (res.status < 400) ids.push(JSON.parse(res.body).id);
+    return res.status;
+  };
+
+  // Pick the items route, find which operations it supports and seed data
+  if (!path) {
+    path = (await send("GET", "/db/items/")).status === 200 ? "/db/items/" : "/items";
+  }
+  if ((await create()) >= 400) throw new Error(`POST ${path} failed; cannot seed items`);
+  const skippedOps = [];
+  // A 404/405 on an item we just created means the route doesn't exist
+  if ([404, 405].includes((await send("GET", itemPath(ids.at(-1)))).status)) {
+    skippedOps.push("get");
+  }
+  if ([404, 405].includes((await send("DELETE", itemPath(ids.at(-1)))).status)) {
+    skippedOps.push("delete");
+  } else {
+    ids.pop();
+  }
+  while (ids.length < SEED_ITEMS) await create();
+
+  const mix = Object.fromEntries(
+    Object.entries(SCENARIOS[scenario]).filter(([op]) => !skippedOps.includes(op))
+  );
+  if (!Object.keys(mix).length) {
+    throw new Error(`${path} supports none of the '${scenario}' operations`);
+  }
+
+  const runOp = async (op) => {
+    if ((op === "get" || op === "delete") && !ids.length) op = "create";
+    if (op === "list") return (await send("GET", `${path}?limit=${LIST_LIMIT}`)).status;
+    if (op === "get") {
+      // Out of ids while in flight so no other worker deletes it meanwhile
+      const [id] = ids.splice(Math.floor(Math.random() * ids.length), 1);
+      try {
+        return (await send("GET", itemPath(id))).status;
+      } finally {
+        ids.push(id);
+      }
+    }
+    if (op === "delete") {
+      const [id] = ids.splice(Math.floor(Math.random() * ids.length), 1);
+      return (await send("DELETE", itemPath(id))).status;
+    }
+    return create();
+  };
+
+  const latencies = [];
+  const opCounts = {};
+  let errors = 0;
+  const measureFrom = performance.now() + warmup * 1000;
+  const stopAt = measureFrom + duration * 1000;
+
+  const worker = async () => {
+    for (;;) {
+      const start = performance.now();
+      if (start >= stopAt) return;
+      const op = pickWeighted(mix);
+      // Only 5xx and transport failures are errors: a 404 on get/delete is
+      // expected, e.g. /items can hand out the same id to two creates
+      let ok;
+      try {
+        ok = (await runOp(op)) < 500;
+      } catch (err) {
+        ok = false;
+      }
+      if (start >= measureFrom) {
+        latencies.push(performance.now() - start);
+        opCounts[op] = (opCounts[op] || 0) + 1;
+        if (!ok) errors += 1;
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: concurrency }, worker));
+  agent.destroy();
+
+  latencies.sort((a, b) => a - b);
+  const ms = (value) => Math.round(value * 100) / 100;
+  return {
+    scenario,
+    path,
+    concurrency,
+    duration_s: duration,
+    requests: latencies.length,
+    errors,
+    rps: Math.round((latencies.length / duration) * 10) / 10,
+    latency_ms: {
+      p50: ms(percentile(latencies, 50)),
+      p90: ms(percentile(latencies, 90)),
+      p99: ms(percentile(latencies, 99)),
+      max: ms(latencies.at(-1) || 0),
+    },
+    ops: opCounts,
+    skipped_ops: skippedOps,
+  };
+}
+
+function formatResult(r) {
+  const lat = r.latency_ms;
+  let line =
+    `${r.scenario.padEnd(6)} ${r.rps.toFixed(1).padStart(9)} req/s  ` +
+    `p50 ${lat.p50.toFixed(2).padStart(7)} ms  p90 ${lat.p90.toFixed(2).padStart(7)} ms  ` +
+    `p99 ${lat.p99.toFixed(2).padStart(7)} ms  errors ${r.errors}`;
+  if (r.skipped_ops.length) line += `  (skipped: ${r.skipped_ops.join(", ")})`;
+  if (!r.requests) line += "  (no requests completed in the measured window)";
+  return line;
+}
+
+async function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const scenarios = args.scenario === "all" ? Object.keys(SCENARIOS) : [args.scenario];
+  const results = [];
+  for (const scenario of scenarios) {
+    const result = await runScenario({ ...args, scenario });
+    console.log(formatResult(result));
+    results.push(result);
+  }
+  if (args.json) fs.writeFileSync(args.json, JSON.stringify(results, null, 2));
+  process.exitCode = results.some((r) => r.errors || !r.requests) ? 1 : 0;
+}
+
+main().catch((err) => {
+  console.error(err.message);
+  process.exitCode = 1;
+});
@@ -0,0 +1,78 @@
+const client = require("prom-client");
+
+/**
+ * Prometheus metrics (added by the DevStart "metrics" option).
+ *
+ *   http_requests_in_flight         requests currently being handled
+ *   http_request_duration_seconds   latency by method, route and status
+ *   db_query_duration_seconds       Postgres / MySQL query time
+ *
+ * Single process: GET /metrics on the API port.
+ * Cluster mode:   the primary serves all workers' metrics on METRICS_PORT (9100).
+ */
+client.collectDefaultMetrics();
+
+const requestsInFlight = new client.Gauge({
+  name: "http_requests_in_flight",
+  help: "HTTP requests currently being handled",
+  aggregator: "sum",
+});
+
+const requestDuration = new client.Histogram({
+  name: "http_request_duration_seconds",
+  help: "HTTP request latency",
+  labelNames: ["method", "route", "status"],
+});
+
+const dbQueryDuration = new client.Histogram({
+  name: "db_query_duration_seconds",
+  help: "Database query latency",
+  labelNames: ["engine", "operation"],
+});
+
+/**
+ * Express middleware: track in-flight requests and latency.
+ * Uses the route template (/db/items/:id) to keep label counts small.
+ */
+function middleware(req, res, next) {
+  if (req.path === "/metrics") return next();
+
+  requestsInFlight.inc();
+  const end = requestDuration.startTimer();
+
+  // "close" fires once per request, also when the client aborts ("finish"
+  // does not), so the in-flight gauge always comes back down
+  res.on("close", () => {
+    requestsInFlight.dec();
+    const route = req.route ? `${req.baseUrl}${req.route.path}` : "unmatched";
+    // 499 (client closed request) when the response never finished
+    const status = res.writableFinished ? res.statusCode : 499;
+    end({ method: req.method, route, status });
+  });
+
+  next();
+}
+
+/**
+ * Time a DB call: timeDbQuery("postgres", sql, () => pool.query(sql, params))
+ */
+async function timeDbQuery(engine, sql, fn) {
+  const operation = String(sql).trim().split(/\s+/, 1)[0].toUpperCase();
+  const end = dbQueryDuration.startTimer({ engine, operation });
+  try {
+    return await fn();
+  } finally {
+    end();
+  }
+}
+
+async function handler(_req, res) {
+  res.set("Content-Type", client.register.contentType);
+  res.end(await client.register.metrics());
+}
+
+module.exports = {
+  middleware,
+  handler,
+  timeDbQuery,
+};
@@ -0,0 +1,121 @@
+require("dotenv").config();
+const cluster = require("node:cluster");
+const os = require("node:os");
+
+/**
+ * Cluster mode: fork one API worker per CPU core.
+ *
+ *   npm run start:cluster
+ *
+ * WEB_CONCURRENCY overrides the number of workers; 1 runs the app in this
+ * process without forking (the Docker default).
+ * Each worker has its own DB pool (see DB_POOL_MAX in .env) and its own
+ * memory, so the in-memory /items example is not shared between workers.
+ *
+ * Signals handled by the primary process:
+ *   SIGUSR2          rolling restart (one worker at a time, no downtime)
+ *   SIGTERM/SIGINT   graceful shutdown (workers finish in-flight requests)
+ */
+const WORKERS = Number(process.env.WEB_CONCURRENCY || os.availableParallelism());
+
+// Time a worker gets to finish in-flight requests before it is killed.
+// Kept below Docker's default 10s stop grace period.
+const SHUTDOWN_TIMEOUT_MS = Number(process.env.SHUTDOWN_TIMEOUT_MS || "5000");
+
+let shuttingDown = false;
+
+/**
+ * Ask a worker to stop accepting connections and exit once it is idle
+ * (index.js runs its shutdown() on "disconnect": server.close + db.close).
+ * Kill it if it takes longer than SHUTDOWN_TIMEOUT_MS.
+ */
+function stopWorker(worker) {
+  return new Promise((resolve) => {
+    const timer = setTimeout(() => worker.kill(), SHUTDOWN_TIMEOUT_MS);
+    worker.once("exit", () => {
+      clearTimeout(timer);
+      resolve();
+    });
+    worker.disconnect();
+  });
+}
+
+async function rollingRestart() {
+  console.log("[cluster] rolling restart");
+  for (const worker of Object.values(cluster.workers)) {
+    // Start the replacement first so there is always a worker listening
+    const replacement = cluster.fork();
+    await new Promise((resolve) => replacement.once("listening", resolve));
+    await stopWorker(worker);
+  }
+  console.log("[cluster] rolling restart done");
+}
+
+async function shutdown(signal) {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`[cluster] ${signal} received, stopping workers`);
+  await Promise.all(Object.values(cluster.workers).map(stopWorker));
+  process.exit(0);
+}
+
+/**
+ * If the metrics addon was selected, serve every worker's metrics
+ * (summed by prom-client) from the primary on METRICS_PORT.
+ */
+function startMetricsServer() {
+  try {
+    require.resolve("./metrics");
+  } catch (err) {
+    return;
+  }
+
+  const http = require("node:http");
+  const { AggregatorRegistry } = require("prom-client");
+  const registry = new AggregatorRegistry();
+  const port = Number(process.env.METRICS_PORT || "9100");
+
+  http
+    .createServer(async (_req, res) => {
+      try {
+        const body = await registry.clusterMetrics();
+        res.writeHead(200, { "Content-Type": registry.contentType });
+        res.end(body);
+      } catch (err) {
+        res.writeHead(500);
+        res.end(err.message);
+      }
+    })
+    .listen(port, () => {
+      console.log(`[cluster] metrics for all workers on :${port}/metrics`);
+    });
+}
+
+function startPrimary() {
+  console.log(`[cluster] primary ${process.pid} starting ${WORKERS} workers`);
+  for (let i = 0; i < WORKERS; i++) {
+    cluster.fork();
+  }
+
+  // Replace workers that crash (but not ones we are stopping on purpose)
+  cluster.on("exit", (worker, code, signal) => {
+    if (shuttingDown || worker.exitedAfterDisconnect) return;
+    console.error(
+      `[cluster] worker ${worker.process.pid} died (${signal || code}), forking a new one`
+    );
+    cluster.fork();
+  });
+
+  startMetricsServer();
+
+  process.on("SIGUSR2", rollingRestart);
+  process.on("SIGTERM", () => shutdown("SIGTERM"));
+  process.on("SIGINT", () => shutdown("SIGINT"));
+}
+
+if (cluster.isPrimary && WORKERS > 1) {
+  startPrimary();
+} else {
+  // Workers (or WEB_CONCURRENCY=1) run the normal single-process app
+  require("./index");
+}
@@ -24,6 +24,16 @@ try {
   console.log("No DB helper found – running without DB health.");
 }
 
+// Optional metrics addon (src/metrics.js) – registered first so it times everything
+try {
+  const metrics = require("./metrics");
+  app.use(metrics.middleware);
+  app.get("/metrics", metrics.handler);
+  console.log("Metrics enabled at /metrics");
+} catch (err) {
+  // metrics addon not selected
+}
+
 // Middleware
 app.use(cors());
 app.use(express.json());
@@ -66,6 +76,27 @@ app.get("/", (_req, res) => {
 });
 
 const PORT = process.env.PORT || 8000;
-app.listen(PORT, () => {
-  console.log(`API listening on http://localhost:${PORT}`);
+const server = app.listen(PORT, () => {
+  console.log(`API listening on http://localhost:${PORT} (pid ${process.pid})`);
 });
+
+// Graceful shutdown: stop accepting connections, finish in-flight requests
+let shuttingDown = false;
+function shutdown(signal) {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`${signal} received, closing server...`);
+  server.close(async () => {
+    if (db && typeof db.close === "function") {
+      await db.close().catch((err) => console.error("DB close failed:", err));
+    }
+    process.exit(0);
+  });
+  // Idle keep-alive sockets would otherwise hold server.close() open
+  server.closeIdleConnections();
+}
+
+process.on("SIGTERM", () => shutdown("SIGTERM"));
+process.on("SIGINT", () => shutdown("SIGINT"));
+// Cluster worker: the primary calls worker.disconnect() to stop us
+process.on("disconnect", () => shutdown("disconnect"));
@@ -1,7 +1,7 @@
 const express = require("express");
 const router = express.Router();
 
-// Fake in-memory "database"
+// Fake in-memory "database" (per process: not shared between cluster workers)
 const items = [];
 
 /**
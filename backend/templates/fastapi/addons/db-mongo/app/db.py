@@ -3,13 +3,24 @@
 from typing import AsyncGenerator
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
+from pymongo.errors import CollectionInvalid, ServerSelectionTimeoutError
+import asyncio
+import logging
 import os
 
+from app.models_mongo import COLLECTIONS
+
 #URI and DBname information has to be in env file.
 #This was left here as a fall back so you will need to update this on your end
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
 MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "app_db")
 
+# How many times init_db() retries while the DB boots.
+# docker-compose waits for the DB healthcheck instead and sets this to 1.
+DB_INIT_RETRIES = int(os.getenv("DB_INIT_RETRIES", "10"))
+
+logger = logging.getLogger(__name__)
+
 _client: AsyncIOMotorClient | None = None
 
 
@@ -34,3 +45,39 @@ async def get_db() -> AsyncGenerator:
     finally:
         # We usually keep the client global, so nothing here.
         ...
+
+
+async def init_db(max_retries: int = DB_INIT_RETRIES, delay_seconds: float = 2.0) -> None:
+    """
+    Create collections (with JSON-schema validation) and their indexes.
+
+    main.py runs this on startup because it is async. All steps are
+    idempotent, so it is safe to run from every replica.
+    """
+    db = get_client()[MONGO_DB_NAME]
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            logger.info("Attempt %d/%d: initializing Mongo...", attempt, max_retries)
+            existing = await db.list_collection_names()
+
+            for name, spec in COLLECTIONS.items():
+                if name not in existing:
+                    try:
+                        await db.create_collection(name, validator=spec["validator"])
+                    except CollectionInvalid:
+                        # Another replica created it first
+                        pass
+                else:
+                    await db.command("collMod", name, validator=spec["validator"])
+
+                if spec["indexes"]:
+                    await db[name].create_indexes(spec["indexes"])
+
+            logger.info("Mongo collections and indexes initialized")
+            return
+        except ServerSelectionTimeoutError as e:
+            logger.warning("Mongo not ready yet: %s", e)
+            if attempt == max_retries:
+                raise
+            await asyncio.sleep(delay_seconds)
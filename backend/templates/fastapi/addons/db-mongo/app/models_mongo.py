@@ -0,0 +1,31 @@
+# app/models_mongo.py
+# Collection definitions used by init_db() in app/db.py.
+# Add a new entry to COLLECTIONS for each collection you create.
+
+from pymongo import ASCENDING, IndexModel
+
+# Fields returned by read queries (Mongo always includes _id)
+ITEM_PROJECTION = {"name": 1, "description": 1}
+
+# Server-side validation, applied when the collection is created/updated
+ITEM_VALIDATOR = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["name"],
+        "properties": {
+            "name": {"bsonType": "string", "minLength": 1},
+            "description": {"bsonType": ["string", "null"]},
+        },
+    }
+}
+
+ITEM_INDEXES = [
+    IndexModel([("name", ASCENDING)], name="name_1"),
+]
+
+COLLECTIONS = {
+    "items": {
+        "validator": ITEM_VALIDATOR,
+        "indexes": ITEM_INDEXES,
+    },
+}
@@ -5,9 +5,14 @@ from typing import Optional, List
 from bson import ObjectId
 
 from app.db import get_db
+from app.models_mongo import ITEM_PROJECTION
+from app.responses import list_response
 
 router = APIRouter(tags=["db-items"])
 
+# Max documents returned by GET /, fetched in a single batch
+LIST_LIMIT = 1000
+
 class ItemCreate(BaseModel):
     name: str
     description: Optional[str] = None
@@ -24,22 +29,32 @@ def to_item(doc) -> ItemOut:
         description=doc.get("description"),
     )
 
+def to_item_dict(doc) -> dict:
+    # Same shape as ItemOut, without building a Pydantic model per document
+    return {
+        "id": str(doc["_id"]),
+        "name": doc["name"],
+        "description": doc.get("description"),
+    }
+
 @router.get("/", response_model=List[ItemOut])
 async def list_items(db=Depends(get_db)):
-    docs = await db["items"].find().to_list(length=1000)
-    return [to_item(d) for d in docs]
+    cursor = db["items"].find({}, ITEM_PROJECTION, batch_size=LIST_LIMIT)
+    docs = await cursor.to_list(length=LIST_LIMIT)
+    return list_response(to_item_dict(d) for d in docs)
 
 @router.post("/", response_model=ItemOut, status_code=201)
 async def create_item(payload: ItemCreate, db=Depends(get_db)):
-    res = await db["items"].insert_one(payload.model_dump())
-    doc = await db["items"].find_one({"_id": res.inserted_id})
+    doc = payload.model_dump()
+    # insert_one sets doc["_id"], so there is no need to read it back
+    await db["items"].insert_one(doc)
     return to_item(doc)
 
 @router.get("/{item_id}", response_model=ItemOut)
 async def get_item(item_id: str, db=Depends(get_db)):
     if not ObjectId.is_valid(item_id):
         raise HTTPException(status_code=400, detail="Invalid id")
-    doc = await db["items"].find_one({"_id": ObjectId(item_id)})
+    doc = await db["items"].find_one({"_id": ObjectId(item_id)}, ITEM_PROJECTION)
     if not doc:
         raise HTTPException(status_code=404, detail="Item not found")
     return to_item(doc)
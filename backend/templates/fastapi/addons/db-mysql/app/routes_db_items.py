@@ -1,14 +1,41 @@
-from typing import List, Optional
+import re
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.orm import Session
 
 from .db import Item as ItemModel
 from .db import get_db
+from .responses import list_response
 
 router = APIRouter(tags=["db-items"])
 
+# Max rows returned by GET / (page with ?offset=)
+LIST_LIMIT = 1000
+
+# ?sort= values; id is the tie-breaker so pages are stable
+SORT_ORDER = {
+    "id": (ItemModel.id.asc(),),
+    "-id": (ItemModel.id.desc(),),
+    "name": (ItemModel.name.asc(), ItemModel.id.asc()),
+    "-name": (ItemModel.name.desc(), ItemModel.id.asc()),
+}
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally (ESCAPE '/')."""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def fulltext_terms(value: str) -> str:
+    """
+    Turn free text into a BOOLEAN MODE query: every word must match,
+    as a word prefix ("blue wid" -> "+blue* +wid*").
+    """
+    return " ".join(f"+{word}*" for word in re.findall(r"\w+", value))
+
 
 # ---------------------------------------------------------
 # Pydantic models for API
@@ -33,8 +60,31 @@ class Item(ItemBase):
 # Routes under /db/items (mounted in main.py)
 # ---------------------------------------------------------
 @router.get("/", response_model=List[Item])
-def list_items(db: Session = Depends(get_db)):
-    return db.query(ItemModel).order_by(ItemModel.id.asc()).all()
+def list_items(
+    name: Optional[str] = Query(None, description="Exact name"),
+    prefix: Optional[str] = Query(None, description="Name starts with"),
+    q: Optional[str] = Query(None, description="Full-text search: words in the name (prefix match per word)"),
+    sort: Literal["id", "-id", "name", "-name"] = "id",
+    limit: int = Query(LIST_LIMIT, ge=1, le=LIST_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    # Select plain columns (no ORM objects) and serialize them directly
+    query = db.query(ItemModel.id, ItemModel.name, ItemModel.description)
+    # name and prefix use the btree index, q uses the FULLTEXT index
+    if name is not None:
+        query = query.filter(ItemModel.name == name)
+    if prefix:
+        query = query.filter(ItemModel.name.like(f"{escape_like(prefix)}%", escape="/"))
+    if q:
+        terms = fulltext_terms(q)
+        if terms:
+            query = query.filter(match(ItemModel.name, against=terms).in_boolean_mode())
+        else:
+            # No words to search for (e.g. only punctuation): plain substring match
+            query = query.filter(ItemModel.name.like(f"%{escape_like(q)}%", escape="/"))
+    rows = query.order_by(*SORT_ORDER[sort]).offset(offset).limit(limit).all()
+    return list_response(row._asdict() for row in rows)
 
 
 @router.post("/", response_model=Item, status_code=201)
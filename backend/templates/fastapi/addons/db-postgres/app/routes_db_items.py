@@ -1,13 +1,29 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from .db import Item as ItemModel
 from .db import get_db
+from .responses import list_response
 
 router = APIRouter(tags=["db-items"])
 
+# Max rows returned by GET / (page with ?offset=)
+LIST_LIMIT = 1000
+
+# ?sort= values; id is the tie-breaker so pages are stable
+SORT_ORDER = {
+    "id": (ItemModel.id.asc(),),
+    "-id": (ItemModel.id.desc(),),
+    "name": (ItemModel.name.asc(), ItemModel.id.asc()),
+    "-name": (ItemModel.name.desc(), ItemModel.id.asc()),
+}
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally (ESCAPE '/')."""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
 class ItemBase(BaseModel):
     name: str
     description: Optional[str] = None
@@ -21,8 +37,26 @@ class Item(ItemBase):
         orm_mode = True
 
 @router.get("/", response_model=List[Item])
-def list_items(db: Session = Depends(get_db)):
-    return db.query(ItemModel).order_by(ItemModel.id.asc()).all()
+def list_items(
+    name: Optional[str] = Query(None, description="Exact name"),
+    prefix: Optional[str] = Query(None, description="Name starts with (case-sensitive)"),
+    q: Optional[str] = Query(None, description="Name contains (case-insensitive)"),
+    sort: Literal["id", "-id", "name", "-name"] = "id",
+    limit: int = Query(LIST_LIMIT, ge=1, le=LIST_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    # Select plain columns (no ORM objects) and serialize them directly
+    query = db.query(ItemModel.id, ItemModel.name, ItemModel.description)
+    # name uses the btree index; prefix and q use the trigram index
+    if name is not None:
+        query = query.filter(ItemModel.name == name)
+    if prefix:
+        query = query.filter(ItemModel.name.like(f"{escape_like(prefix)}%", escape="/"))
+    if q:
+        query = query.filter(ItemModel.name.ilike(f"%{escape_like(q)}%", escape="/"))
+    rows = query.order_by(*SORT_ORDER[sort]).offset(offset).limit(limit).all()
+    return list_response(row._asdict() for row in rows)
 
 @router.post("/", response_model=Item, status_code=201)
 def create_item(payload: ItemCreate, db: Session = Depends(get_db)):
@@ -0,0 +1,107 @@
+import logging, os
+from pathlib import Path
+from typing import AsyncGenerator
+from sqlalchemy import Column, Integer, String, Text, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+#The database file location has to be in env file.
+#This was left here as a fall back so you will need to update this on your end
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./data/app.db")
+
+# PRAGMAs applied to every connection (https://www.sqlite.org/pragma.html)
+# NORMAL is safe with WAL: a power loss can only lose the last commits, never corrupt the DB.
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL").upper()
+# Bytes of the DB file read through mmap instead of read() syscalls.
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# Page cache per connection; negative values are KiB (-65536 = 64 MiB).
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+# How long a writer waits for another process's write lock before failing.
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# Read connections per process. Writes always go through a single connection.
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "4"))
+
+if SQLITE_SYNCHRONOUS not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+    raise ValueError(f"Invalid SQLITE_SYNCHRONOUS: {SQLITE_SYNCHRONOUS}")
+
+logger = logging.getLogger(__name__)
+
+# SQLite allows one writer at a time. Instead of letting every request race
+# for the write lock (and fail with "database is locked"), writes share one
+# connection per process and queue on the pool; readers use their own pool
+# and never block the writer thanks to WAL.
+engine = create_async_engine(DATABASE_URL, pool_size=1, max_overflow=0)
+read_engine = create_async_engine(
+    DATABASE_URL, pool_size=SQLITE_READ_POOL_SIZE, max_overflow=0
+)
+
+WriteSession = async_sessionmaker(engine, expire_on_commit=False)
+ReadSession = async_sessionmaker(read_engine, expire_on_commit=False)
+Base = declarative_base()
+
+def _apply_pragmas(dbapi_connection) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size = {SQLITE_CACHE_SIZE}")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.close()
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_write_connect(dbapi_connection, _connection_record):
+    _apply_pragmas(dbapi_connection)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode = WAL")
+    cursor.execute(f"PRAGMA synchronous = {SQLITE_SYNCHRONOUS}")
+    cursor.execute("PRAGMA foreign_keys = ON")
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself (see _on_write_begin)
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine.sync_engine, "begin")
+def _on_write_begin(conn):
+    # Take the write lock up front. A deferred transaction that upgrades from
+    # read to write fails immediately if another process holds the lock;
+    # BEGIN IMMEDIATE waits for busy_timeout instead.
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+@event.listens_for(read_engine.sync_engine, "connect")
+def _on_read_connect(dbapi_connection, _connection_record):
+    _apply_pragmas(dbapi_connection)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only = ON")
+    cursor.close()
+
+class Item(Base):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True, index=True)
+    # btree: ?name=, ?prefix= (GLOB) and ?sort=name
+    name = Column(String(200), nullable=False, index=True)
+    description = Column(Text, nullable=True)
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session (GET routes)."""
+    async with ReadSession() as session:
+        yield session
+
+async def get_write_db() -> AsyncGenerator[AsyncSession, None]:
+    """Session on the single writer connection (POST/PUT/DELETE routes)."""
+    async with WriteSession() as session:
+        yield session
+
+async def init_db() -> None:
+    # The DB file is created on first connect, but its folder is not
+    database = engine.url.database
+    if database and database != ":memory:":
+        Path(database).parent.mkdir(parents=True, exist_ok=True)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # create_all skips existing tables, including their newer indexes
+        for index in Item.__table__.indexes:
+            await conn.run_sync(index.create, checkfirst=True)
+    logger.info("Database tables initialized (%s)", DATABASE_URL)
+
+async def check_connection() -> None:
+    async with read_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
@@ -0,0 +1,89 @@
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .db import Item as ItemModel
+from .db import get_db, get_write_db
+from .responses import list_response
+
+router = APIRouter(tags=["db-items"])
+
+ITEM_COLUMNS = (ItemModel.id, ItemModel.name, ItemModel.description)
+
+# Max rows returned by GET / (page with ?offset=)
+LIST_LIMIT = 1000
+
+# ?sort= values; id is the tie-breaker so pages are stable
+SORT_ORDER = {
+    "id": (ItemModel.id.asc(),),
+    "-id": (ItemModel.id.desc(),),
+    "name": (ItemModel.name.asc(), ItemModel.id.asc()),
+    "-name": (ItemModel.name.desc(), ItemModel.id.asc()),
+}
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally (ESCAPE '/')."""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+def escape_glob(value: str) -> str:
+    """Escape GLOB wildcards (*, ?, [) so user input is matched literally."""
+    return "".join(f"[{c}]" if c in "*?[" else c for c in value)
+
+class ItemBase(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+class ItemCreate(ItemBase):
+    pass
+
+class Item(ItemBase):
+    id: int
+
+@router.get("/", response_model=List[Item])
+async def list_items(
+    name: Optional[str] = Query(None, description="Exact name"),
+    prefix: Optional[str] = Query(None, description="Name starts with (case-sensitive)"),
+    q: Optional[str] = Query(None, description="Name contains (case-insensitive for ASCII)"),
+    sort: Literal["id", "-id", "name", "-name"] = "id",
+    limit: int = Query(LIST_LIMIT, ge=1, le=LIST_LIMIT),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    # Select plain columns (no ORM objects) and serialize them directly
+    stmt = select(*ITEM_COLUMNS)
+    if name is not None:
+        stmt = stmt.where(ItemModel.name == name)
+    if prefix:
+        # GLOB (case-sensitive) can use the btree index on name; LIKE cannot
+        stmt = stmt.where(ItemModel.name.op("GLOB")(f"{escape_glob(prefix)}*"))
+    if q:
+        # Substring search scans the table; fine for SQLite-sized data
+        stmt = stmt.where(ItemModel.name.like(f"%{escape_like(q)}%", escape="/"))
+    stmt = stmt.order_by(*SORT_ORDER[sort]).offset(offset).limit(limit)
+    result = await db.execute(stmt)
+    return list_response(row._asdict() for row in result)
+
+@router.post("/", response_model=Item, status_code=201)
+async def create_item(payload: ItemCreate, db: AsyncSession = Depends(get_write_db)):
+    db_item = ItemModel(name=payload.name, description=payload.description)
+    db.add(db_item)
+    await db.commit()
+    # The id comes back with the INSERT, so there is no need to read the row back
+    return {"id": db_item.id, "name": db_item.name, "description": db_item.description}
+
+@router.get("/{item_id}", response_model=Item)
+async def get_item(item_id: int, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(select(*ITEM_COLUMNS).where(ItemModel.id == item_id))
+    row = result.first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return row._asdict()
+
+@router.delete("/{item_id}", status_code=204)
+async def delete_item(item_id: int, db: AsyncSession = Depends(get_write_db)):
+    result = await db.execute(delete(ItemModel).where(ItemModel.id == item_id))
+    if not result.rowcount:
+        raise HTTPException(status_code=404, detail="Item not found")
+    await db.commit()
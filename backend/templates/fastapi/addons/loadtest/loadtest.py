@@ -0,0 +1,296 @@
+"""
+Offline load generator for this API (standard library only, no network
+access or extra packages needed).
+
+Usage (with the API running):
+    python loadtest.py
+    python loadtest.py --scenario list --duration 30 --concurrency 64
+    python loadtest.py --url http://localhost:8000 --json results.json
+
+Scenarios run against /db/items/ when a DB addon is mounted, else /items:
+    crud   50% list, 20% get, 20% create, 10% delete
+    list   90% list, 10% get
+    write  80% create, 20% delete
+
+Operations the API doesn't expose (e.g. no DELETE route) are skipped.
+Prints requests/second and latency percentiles for the measured window;
+errors counts 5xx responses and connection failures.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+SCENARIOS: Dict[str, Dict[str, int]] = {
+    "crud": {"list": 50, "get": 20, "create": 20, "delete": 10},
+    "list": {"list": 90, "get": 10},
+    "write": {"create": 80, "delete": 20},
+}
+
+# Items created before measuring so list/get have something to read
+SEED_ITEMS = 100
+
+# Page size sent with list requests (ignored by routes without ?limit=)
+LIST_LIMIT = 50
+
+
+class Connection:
+    """Minimal HTTP/1.1 keep-alive client, one request at a time."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, body=None) -> Tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        payload = b"" if body is None else json.dumps(body).encode()
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+        )
+        if body is not None:
+            head += "Content-Type: application/json\r\n"
+        self.writer.write(head.encode("latin-1") + b"\r\n" + payload)
+
+        try:
+            status_line = await self.reader.readline()
+            if not status_line:
+                raise ConnectionError("server closed the connection")
+            status = int(status_line.split()[1])
+
+            headers: Dict[str, str] = {}
+            while True:
+                line = await self.reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                key, _, value = line.decode("latin-1").partition(":")
+                headers[key.strip().lower()] = value.strip()
+
+            if headers.get("transfer-encoding", "").lower() == "chunked":
+                data = await self._read_chunked()
+            elif "content-length" in headers:
+                data = await self.reader.readexactly(int(headers["content-length"]))
+            elif status in (204, 304):
+                data = b""
+            else:
+                data = await self.reader.read()
+                headers["connection"] = "close"
+        except Exception:
+            self.close()
+            raise
+
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, data
+
+    async def _read_chunked(self) -> bytes:
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readline()
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LoadTest:
+    def __init__(self, url: str, scenario: str, concurrency: int,
+                 duration: float, warmup: float, path: Optional[str] = None):
+        parsed = urllib.parse.urlsplit(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 80
+        self.scenario = scenario
+        self.concurrency = concurrency
+        self.duration = duration
+        self.warmup = warmup
+        self.path = path
+        self.ids: List = []
+        self.created = 0
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.op_counts: Dict[str, int] = {}
+        self.disabled_ops: List[str] = []
+
+    def item_path(self, item_id) -> str:
+        return f"{self.path.rstrip('/')}/{item_id}"
+
+    async def create(self, conn: Connection) -> int:
+        self.created += 1
+        status, data = await conn.request(
+            "POST", self.path, {"name": f"item-{self.created}", "description": "load test"}
+        )
+        if status < 400:
+            self.ids.append(json.loads(data)["id"])
+        return status
+
+    async def run_op(self, conn: Connection, op: str) -> int:
+        if op in ("get", "delete") and not self.ids:
+            op = "create"
+        if op == "list":
+            return (await conn.request("GET", f"{self.path}?limit={LIST_LIMIT}"))[0]
+        if op == "get":
+            # Out of self.ids while in flight so no other worker deletes it meanwhile
+            item_id = self.ids.pop(random.randrange(len(self.ids)))
+            try:
+                return (await conn.request("GET", self.item_path(item_id)))[0]
+            finally:
+                self.ids.append(item_id)
+        if op == "delete":
+            item_id = self.ids.pop(random.randrange(len(self.ids)))
+            return (await conn.request("DELETE", self.item_path(item_id)))[0]
+        return await self.create(conn)
+
+    async def prepare(self, conn: Connection) -> None:
+        """Pick the items route, find which operations it supports and seed data."""
+        if self.path is None:
+            status, _ = await conn.request("GET", "/db/items/")
+            self.path = "/db/items/" if status == 200 else "/items"
+
+        if await self.create(conn) >= 400:
+            raise RuntimeError(f"POST {self.path} failed; cannot seed items")
+        # A 404/405 on an item we just created means the route doesn't exist
+        status, _ = await conn.request("GET", self.item_path(self.ids[-1]))
+        if status in (404, 405):
+            self.disabled_ops.append("get")
+        status, _ = await conn.request("DELETE", self.item_path(self.ids[-1]))
+        if status in (404, 405):
+            self.disabled_ops.append("delete")
+        else:
+            self.ids.pop()
+
+        while len(self.ids) < SEED_ITEMS:
+            await self.create(conn)
+
+    async def worker(self, ops: List[str], weights: List[int],
+                     measure_from: float, stop_at: float) -> None:
+        conn = Connection(self.host, self.port)
+        while True:
+            start = time.perf_counter()
+            if start >= stop_at:
+                break
+            op = random.choices(ops, weights)[0]
+            # Only 5xx and transport failures are errors: a 404 on get/delete is
+            # expected, e.g. /items can hand out the same id to two creates
+            try:
+                ok = await self.run_op(conn, op) < 500
+            except Exception:
+                ok = False
+            if start >= measure_from:
+                self.latencies.append(time.perf_counter() - start)
+                self.op_counts[op] = self.op_counts.get(op, 0) + 1
+                if not ok:
+                    self.errors += 1
+        conn.close()
+
+    async def run(self) -> Dict:
+        conn = Connection(self.host, self.port)
+        await self.prepare(conn)
+        conn.close()
+
+        mix = {op: w for op, w in SCENARIOS[self.scenario].items()
+               if op not in self.disabled_ops}
+        if not mix:
+            raise RuntimeError(f"{self.path} supports none of the '{self.scenario}' operations")
+
+        now = time.perf_counter()
+        measure_from = now + self.warmup
+        stop_at = measure_from + self.duration
+        await asyncio.gather(*(
+            self.worker(list(mix), list(mix.values()), measure_from, stop_at)
+            for _ in range(self.concurrency)
+        ))
+
+        latencies = sorted(self.latencies)
+        ms = lambda seconds: round(seconds * 1000, 2)
+        return {
+            "scenario": self.scenario,
+            "path": self.path,
+            "concurrency": self.concurrency,
+            "duration_s": self.duration,
+            "requests": len(latencies),
+            "errors": self.errors,
+            "rps": round(len(latencies) / self.duration, 1),
+            "latency_ms": {
+                "p50": ms(percentile(latencies, 50)),
+                "p90": ms(percentile(latencies, 90)),
+                "p99": ms(percentile(latencies, 99)),
+                "max": ms(latencies[-1] if latencies else 0.0),
+            },
+            "ops": self.op_counts,
+            "skipped_ops": self.disabled_ops,
+        }
+
+
+def run(url: str = "http://localhost:8000", scenario: str = "crud",
+        duration: float = 10.0, concurrency: int = 32, warmup: float = 2.0,
+        path: Optional[str] = None) -> Dict:
+    """Run one scenario against a running API and return its results."""
+    if scenario not in SCENARIOS:
+        raise ValueError(f"Unknown scenario '{scenario}' (choose from {', '.join(SCENARIOS)})")
+    return asyncio.run(LoadTest(url, scenario, concurrency, duration, warmup, path).run())
+
+
+def format_result(result: Dict) -> str:
+    lat = result["latency_ms"]
+    line = (
+        f"{result['scenario']:<6} {result['rps']:>9.1f} req/s  "
+        f"p50 {lat['p50']:>7.2f} ms  p90 {lat['p90']:>7.2f} ms  "
+        f"p99 {lat['p99']:>7.2f} ms  errors {result['errors']}"
+    )
+    if result["skipped_ops"]:
+        line += f"  (skipped: {', '.join(result['skipped_ops'])})"
+    if not result["requests"]:
+        line += "  (no requests completed in the measured window)"
+    return line
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the items API.")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--scenario", default="all", choices=["all", *SCENARIOS])
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before each scenario")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent keep-alive connections")
+    parser.add_argument("--path", help="items route (default: /db/items/ if mounted, else /items)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    scenarios = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    results = []
+    for scenario in scenarios:
+        result = run(args.url, scenario, args.duration, args.concurrency, args.warmup, args.path)
+        print(format_result(result), flush=True)
+        results.append(result)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if any(r["errors"] or not r["requests"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
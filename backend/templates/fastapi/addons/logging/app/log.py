@@ -0,0 +1,160 @@
+# app/log.py
+# Added by the DevStart "logging" option.
+#
+# Structured (JSON) logs that never block a request:
+#   - log calls only put the record on an in-memory queue (QueueHandler)
+#   - a background thread (QueueListener) formats and writes them to stdout
+#
+# Every request gets an ID (X-Request-ID header, generated if missing) that is
+# added to every log line written while handling it, plus one access line with
+# its duration.
+#
+# Env:
+#   LOG_LEVEL                DEBUG / INFO / WARNING ... (default INFO)
+#   LOG_ACCESS_SAMPLE_RATE   fraction of successful requests to log (default 1.0);
+#                            4xx/5xx responses are always logged
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_ACCESS_SAMPLE_RATE = float(os.getenv("LOG_ACCESS_SAMPLE_RATE", "1.0"))
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+access_logger = logging.getLogger("app.access")
+
+
+class JsonFormatter(logging.Formatter):
+    # Attributes every LogRecord has; anything else was passed via `extra=`
+    _STANDARD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in self._STANDARD_ATTRS and key not in entry:
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = record.stack_info
+        return json.dumps(entry, default=str)
+
+
+class JsonQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler.prepare() would merge the traceback into the message and
+    drop exc_info. Keep it in exc_text instead, so JsonFormatter can write it
+    as its own field on the listener thread.
+    """
+
+    traceback_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            # Traceback objects can't wait on the queue; format them here
+            record.exc_text = self.traceback_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Runs in the caller's thread/task, so the ContextVar is still set here
+        record.request_id = request_id_var.get()
+        return True
+
+
+def setup_logging() -> None:
+    """Send all logs (app + uvicorn) through one non-blocking JSON handler."""
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+    queue_handler = JsonQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)  # flush what is left on shutdown
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+
+    # uvicorn sets up its own handlers; route them through the queue too
+    for name in ("uvicorn", "uvicorn.error"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    # RequestContextMiddleware writes the access log (with request_id + duration)
+    logging.getLogger("uvicorn.access").disabled = True
+
+
+class RequestContextMiddleware:
+    """Plain ASGI middleware: request ID + one access log line per request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for key, value in scope["headers"]:
+            if key == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [
+                    (b"x-request-id", request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if status_code >= 400 or random.random() < LOG_ACCESS_SAMPLE_RATE:
+                access_logger.info(
+                    "request finished",
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status_code,
+                        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                    },
+                )
+            request_id_var.reset(token)
@@ -0,0 +1,184 @@
+# app/metrics.py
+# Added by the DevStart "metrics" option.
+#
+# Prometheus metrics served at GET /metrics:
+#   http_requests_in_flight                 requests currently being handled
+#   http_request_duration_seconds           latency by method, route and status
+#   db_query_duration_seconds               SQLAlchemy / Mongo query time
+#
+# With several uvicorn workers (WEB_CONCURRENCY > 1) set PROMETHEUS_MULTIPROC_DIR
+# to an empty directory so /metrics reports all workers, not just one. Empty it
+# before the workers start (the Docker CMD does) so old workers' files are not
+# counted again.
+
+import os
+import time
+
+from fastapi import FastAPI
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled",
+    multiprocess_mode="livesum",
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route", "status"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database query latency",
+    ["engine", "operation"],
+)
+
+# Connection/transaction setup (e.g. the SQLite addon's BEGIN IMMEDIATE),
+# not queries, so left out of db_query_duration_seconds
+UNTIMED_STATEMENTS = {"PRAGMA", "BEGIN", "COMMIT", "ROLLBACK"}
+
+
+def route_template(scope) -> str:
+    """
+    Turn /db/items/42 back into /db/items/{item_id} so every item shares one
+    label (keeps the number of time series small).
+
+    Built from path_params because route.path does not include router
+    prefixes on every FastAPI version.
+    """
+    if scope.get("route") is None:
+        return "unmatched"
+
+    path = scope["path"]
+    # Right to left, so each value is replaced in its own segment
+    for name, value in reversed(list(scope.get("path_params", {}).items())):
+        head, sep, tail = path.rpartition(f"/{value}")
+        if sep:
+            path = f"{head}/{{{name}}}{tail}"
+    return path
+
+
+class PrometheusMiddleware:
+    """Plain ASGI middleware (cheaper than BaseHTTPMiddleware)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            REQUEST_DURATION.labels(
+                scope["method"], route_template(scope), str(status_code)
+            ).observe(time.perf_counter() - start)
+
+
+def metrics_endpoint(_request: Request) -> Response:
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        data = generate_latest(registry)
+    else:
+        data = generate_latest()
+    return Response(data, media_type=CONTENT_TYPE_LATEST)
+
+
+def instrument_sqlalchemy(engine) -> None:
+    from sqlalchemy import event
+
+    # AsyncEngine (SQLite addon) only accepts listeners on its sync engine
+    engine = getattr(engine, "sync_engine", engine)
+
+    def operation_of(statement: str) -> str:
+        return statement.lstrip().split(None, 1)[0].upper()
+
+    # The start time lives on the statement's execution context, so a failed
+    # statement (no after_cursor_execute) can't leave it behind for the next one
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and operation_of(statement) not in UNTIMED_STATEMENTS:
+            context.query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "query_start", None)
+        if start is None:
+            return
+        operation = operation_of(statement)
+        DB_QUERY_DURATION.labels(engine.dialect.name, operation).observe(
+            time.perf_counter() - start
+        )
+
+
+def instrument_pymongo() -> None:
+    """Time every Mongo command (clients created after this call)."""
+    from pymongo import monitoring
+
+    class CommandTimer(monitoring.CommandListener):
+        def started(self, event):
+            pass
+
+        def succeeded(self, event):
+            DB_QUERY_DURATION.labels("mongo", event.command_name).observe(
+                event.duration_micros / 1_000_000
+            )
+
+        def failed(self, event):
+            DB_QUERY_DURATION.labels("mongo", event.command_name).observe(
+                event.duration_micros / 1_000_000
+            )
+
+    monitoring.register(CommandTimer())
+
+
+def setup_metrics(app: FastAPI) -> None:
+    """Add the middleware, /metrics route and DB timing hooks. Called from main.py."""
+    app.add_middleware(PrometheusMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+    if MULTIPROC_DIR:
+        # Drop this worker's live gauge files (http_requests_in_flight) on exit
+        app.router.add_event_handler(
+            "shutdown", lambda: multiprocess.mark_process_dead(os.getpid())
+        )
+
+    try:
+        from app import db as db_module
+    except ImportError:
+        return
+
+    if hasattr(db_module, "engine"):
+        instrument_sqlalchemy(db_module.engine)
+        # SQLite addon: reads use a separate engine from the single writer
+        if hasattr(db_module, "read_engine"):
+            instrument_sqlalchemy(db_module.read_engine)
+    elif hasattr(db_module, "get_client"):
+        instrument_pymongo()
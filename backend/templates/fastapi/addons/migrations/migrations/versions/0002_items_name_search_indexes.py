@@ -0,0 +1,51 @@
+"""index items.name for filtering and search
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # btree: ?name=, ?prefix= and ?sort=name
+    op.create_index("ix_items_name", "items", ["name"], unique=False)
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # Trigram GIN: ?prefix= and ?q= (ILIKE '%...%')
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_items_name_trgm",
+            "items",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+    elif dialect == "mysql":
+        # FULLTEXT: ?q= (MATCH ... AGAINST)
+        op.create_index(
+            "ix_items_name_fulltext", "items", ["name"], mysql_prefix="FULLTEXT"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.drop_index("ix_items_name_trgm", table_name="items")
+    elif dialect == "mysql":
+        op.drop_index("ix_items_name_fulltext", table_name="items")
+
+    op.drop_index("ix_items_name", table_name="items")
@@ -0,0 +1,39 @@
+# app/performance.py
+# Added by the DevStart "performance" option.
+#
+# - Uses orjson for every JSON response (much faster than the stdlib json module)
+# - Compresses large responses with GZip
+#
+# Tune compression in .env:
+#   GZIP_MINIMUM_SIZE=1000    responses smaller than this (bytes) are sent as-is
+#   GZIP_COMPRESS_LEVEL=5     1 (fastest) .. 9 (smallest)
+
+import os
+from typing import Any
+
+import orjson
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+
+GZIP_MINIMUM_SIZE = int(os.getenv("GZIP_MINIMUM_SIZE", "1000"))
+GZIP_COMPRESS_LEVEL = int(os.getenv("GZIP_COMPRESS_LEVEL", "5"))
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Picked up by app/responses.py and used as the app's default_response_class
+DEFAULT_RESPONSE_CLASS = ORJSONResponse
+
+
+def setup_performance(app: FastAPI) -> None:
+    """Add response compression. Called once from main.py."""
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=GZIP_MINIMUM_SIZE,
+        compresslevel=GZIP_COMPRESS_LEVEL,
+    )
@@ -1,8 +1,28 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
+import logging
+import os
+
+# ---------- Logging ----------
+# The logging addon ships app/log.py (non-blocking JSON logs with request IDs).
+# Without it, fall back to plain text logs.
+try:
+    from app import log as log_module
+    log_module.setup_logging()
+except ImportError:
+    log_module = None
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(levelname)s %(name)s: %(message)s",
+    )
+
+logger = logging.getLogger("app")
+
+from app.responses import DEFAULT_RESPONSE_CLASS, PERFORMANCE_ENABLED, list_response
 
 app = FastAPI(
+    default_response_class=DEFAULT_RESPONSE_CLASS,
     title="DevStart API starter",
     version="0.1.0",
     description=(
@@ -18,6 +38,16 @@ app = FastAPI(
     ),
 )
 
+if log_module is not None:
+    app.add_middleware(log_module.RequestContextMiddleware)
+
+# ---------- OPTIONAL: performance addon (orjson + GZip) ----------
+
+if PERFORMANCE_ENABLED:
+    from app.performance import setup_performance
+    setup_performance(app)
+    logger.info("Performance addon enabled")
+
 
 # ---------- Pydantic models ----------
 
@@ -77,7 +107,7 @@ def list_items():
     TODO:
     - Replace this with a SELECT query.
     """
-    return FAKE_DB
+    return list_response(item.model_dump() for item in FAKE_DB)
 
 
 @app.post("/items", response_model=Item, status_code=201, tags=["items"])
@@ -147,18 +177,30 @@ def delete_item(item_id: int):
 # as long as it ships `app/db.py` and `app/routes_db_items.py`.
 try:
     from app import db as db_module
-    print("Imported app.db")
+    logger.info("Imported app.db")
 
     if hasattr(db_module, "init_db"):
-        print("Running init_db()...")
-        db_module.init_db()
+        # Run on startup rather than at import time. Works for both sync
+        # (SQLAlchemy) and async (Mongo) init_db() functions.
+        logger.info("Scheduling init_db() on startup...")
+        app.router.add_event_handler("startup", db_module.init_db)
 
     from app.routes_db_items import router as db_items_router
-    print("Imported app.routes_db_items")
+    logger.info("Imported app.routes_db_items")
 
     app.include_router(db_items_router, prefix="/db/items")
-    print("DB-backed routes mounted at /db/items")
+    logger.info("DB-backed routes mounted at /db/items")
 
 except Exception as e:
-    print("DB addon mount failed:", repr(e))
+    logger.warning("DB addon mount failed: %r", e)
+
+
+# ---------- OPTIONAL: metrics addon (Prometheus /metrics) ----------
 
+# Runs after the DB addon so it can hook into app.db's engine/client.
+try:
+    from app.metrics import setup_metrics
+    setup_metrics(app)
+    logger.info("Metrics enabled at /metrics")
+except ImportError:
+    pass
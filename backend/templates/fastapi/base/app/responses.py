@@ -0,0 +1,32 @@
+# app/responses.py
+from typing import Any, Iterable, List, Mapping, Union
+
+from fastapi.responses import JSONResponse
+
+# If the performance addon was selected, use its (orjson) response class.
+# Only a missing app/performance.py means "not selected": an ImportError from
+# inside it (e.g. orjson not installed) is a real error.
+try:
+    from app.performance import DEFAULT_RESPONSE_CLASS
+    PERFORMANCE_ENABLED = True
+except ModuleNotFoundError as e:
+    if e.name != "app.performance":
+        raise
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+    PERFORMANCE_ENABLED = False
+
+
+def list_response(
+    rows: Iterable[Mapping[str, Any]],
+) -> Union[JSONResponse, List[Mapping[str, Any]]]:
+    """
+    Return a list of plain dict rows from a route.
+
+    With the performance addon, serialize them straight to JSON: returning a
+    Response skips FastAPI's response_model validation, which is the main CPU
+    cost on big lists (response_model still documents the shape).
+    Without it, return the rows so response_model validates and filters them.
+    """
+    if PERFORMANCE_ENABLED:
+        return DEFAULT_RESPONSE_CLASS(content=list(rows))
+    return list(rows)
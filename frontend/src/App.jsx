@@ -9,8 +9,7 @@ const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000
 const ALL_DB_OPTIONS = [
   { value: "none",     label: "No database (just in-memory)" },
   { value: "postgres", label: "Postgres (via DATABASE_URL)" },
-  //SQLite will be reactivated once I figure out how to make it work
-  //{ value: "sqlite",   label: "SQLite (local file)" },
+  { value: "sqlite",   label: "SQLite (local file)" },
   { value: "mongo",    label: "MongoDB" },
   {value: "mysql",     label: "MySQL"}
 ];
@@ -19,13 +18,7 @@ function getDbOptionsForStack(stackId) {
   // No stack yet? show everything
   if (!stackId) return ALL_DB_OPTIONS;
 
-  // Any Express backend: hide SQLite
-  //May use this once SQLite is up and running 
-  /*if (stackId.startsWith("express")) {
-    return ALL_DB_OPTIONS.filter((opt) => opt.value !== "sqlite");
-  }*/
-
-  // FastAPI or anything else: allow all
+  // Every stack supports every engine
   return ALL_DB_OPTIONS;
 }
 
@@ -36,6 +29,11 @@ function App() {
   const [includeDocker, setIncludeDocker] = useState(false);
   const [includeAuth, setIncludeAuth] = useState(false);
   const [includeCI, setIncludeCI] = useState(false);
+  const [includePerformance, setIncludePerformance] = useState(false);
+  const [includeMigrations, setIncludeMigrations] = useState(false);
+  const [includeMetrics, setIncludeMetrics] = useState(false);
+  const [includeLogging, setIncludeLogging] = useState(false);
+  const [includeLoadTest, setIncludeLoadTest] = useState(false);
   const [dbEngine, setDbEngine] = useState("none");
 
 
@@ -83,7 +81,7 @@ function App() {
     const options = getDbOptionsForStack(stackId);
     const validValues = options.map((o) => o.value);
 
-    // If current dbEngine isn't allowed anymore (e.g. sqlite on Express),
+    // If current dbEngine isn't allowed anymore for the new stack,
     // reset to the first valid option.
     if (!validValues.includes(dbEngine)) {
       setDbEngine(validValues[0] ?? "none");
@@ -116,6 +114,11 @@ function App() {
         includeDocker,
         includeAuth: AUTH_ENABLED ? includeAuth : false,
         includeCI: CI_ENABLED ? includeCI : false,
+        includePerformance: stackId === "fastapi" ? includePerformance : false,
+        includeMigrations: MIGRATIONS_AVAILABLE ? includeMigrations : false,
+        includeMetrics,
+        includeLogging: stackId === "fastapi" ? includeLogging : false,
+        includeLoadTest,
         dbEngine, 
       };
 
@@ -150,6 +153,11 @@ function App() {
       setIncludeDocker(false);
       setIncludeAuth(false);
       setIncludeCI(false);
+      setIncludePerformance(false);
+      setIncludeMigrations(false);
+      setIncludeMetrics(false);
+      setIncludeLogging(false);
+      setIncludeLoadTest(false);
       setDbEngine("none");
 
       setError("");
@@ -160,6 +168,10 @@ function App() {
     const AUTH_ENABLED = false;
     const CI_ENABLED = false;
 
+    // Alembic migrations only exist for FastAPI + SQL databases
+    const MIGRATIONS_AVAILABLE =
+      stackId === "fastapi" && (dbEngine === "postgres" || dbEngine === "mysql");
+
 
   // Simple UI
   return (
@@ -282,6 +294,85 @@ function App() {
                 <span>Docker</span>
               </label>
 
+              {/* Performance (FastAPI only) */}
+              <label
+                className={`inline-flex items-center gap-2 ${
+                  stackId === "fastapi" ? "" : "opacity-50 cursor-not-allowed"
+                }`}
+                title="orjson responses + GZip compression"
+              >
+                <input
+                  type="checkbox"
+                  checked={includePerformance}
+                  onChange={(e) => setIncludePerformance(e.target.checked)}
+                  disabled={stackId !== "fastapi"}
+                  className="h-3 w-3 rounded border-slate-500 bg-slate-900"
+                />
+                <span>Performance</span>
+              </label>
+
+              {/* Migrations (FastAPI + Postgres/MySQL only) */}
+              <label
+                className={`inline-flex items-center gap-2 ${
+                  MIGRATIONS_AVAILABLE ? "" : "opacity-50 cursor-not-allowed"
+                }`}
+                title="Alembic migrations instead of create_all on startup"
+              >
+                <input
+                  type="checkbox"
+                  checked={includeMigrations}
+                  onChange={(e) => setIncludeMigrations(e.target.checked)}
+                  disabled={!MIGRATIONS_AVAILABLE}
+                  className="h-3 w-3 rounded border-slate-500 bg-slate-900"
+                />
+                <span>Migrations</span>
+              </label>
+
+              {/* Metrics (Prometheus) */}
+              <label
+                className="inline-flex items-center gap-2"
+                title="Prometheus /metrics (request + DB timing)"
+              >
+                <input
+                  type="checkbox"
+                  checked={includeMetrics}
+                  onChange={(e) => setIncludeMetrics(e.target.checked)}
+                  className="h-3 w-3 rounded border-slate-500 bg-slate-900"
+                />
+                <span>Metrics</span>
+              </label>
+
+              {/* Logging (FastAPI only) */}
+              <label
+                className={`inline-flex items-center gap-2 ${
+                  stackId === "fastapi" ? "" : "opacity-50 cursor-not-allowed"
+                }`}
+                title="JSON logs with request IDs, written off the event loop"
+              >
+                <input
+                  type="checkbox"
+                  checked={includeLogging}
+                  onChange={(e) => setIncludeLogging(e.target.checked)}
+                  disabled={stackId !== "fastapi"}
+                  className="h-3 w-3 rounded border-slate-500 bg-slate-900"
+                />
+                <span>Logging</span>
+              </label>
+
+              {/* Load test script */}
+              <label
+                className="inline-flex items-center gap-2"
+                title="Offline load generator: RPS + latency percentiles for the items routes"
+              >
+                <input
+                  type="checkbox"
+                  checked={includeLoadTest}
+                  onChange={(e) => setIncludeLoadTest(e.target.checked)}
+                  className="h-3 w-3 rounded border-slate-500 bg-slate-900"
+                />
+                <span>Load test</span>
+              </label>
+
               {/* Auth (disabled) */}
               <label
                 className={`inline-flex items-center gap-2 ${